@@ -5,16 +5,17 @@ Simple script to create a diver silhouette icon for Mares Puck Pro app
 
 import os
 import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 
-def create_diver_svg(size):
-    """Create a simple diver silhouette SVG"""
-    svg_content = f'''<?xml version="1.0" encoding="UTF-8"?>
+# Diver silhouette drawn on a 100-unit grid, scaled to the icon size
+_SVG_TEMPLATE = '''<?xml version="1.0" encoding="UTF-8"?>
 <svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {size} {size}" width="{size}" height="{size}">
   <!-- Blue background circle -->
-  <circle cx="{size//2}" cy="{size//2}" r="{size//2 - 2}" fill="#1B4D84" stroke="none"/>
+  <circle cx="{half}" cy="{half}" r="{radius}" fill="#1B4D84" stroke="none"/>
   
   <!-- Diver silhouette -->
-  <g transform="translate({size//2}, {size//2}) scale({size/100})">
+  <g transform="translate({half}, {half}) scale({scale})">
     <!-- Head -->
     <circle cx="0" cy="-25" r="8" fill="white"/>
     
@@ -42,48 +43,158 @@ def create_diver_svg(size):
     <circle cx="-12" cy="-38" r="1" fill="white" opacity="0.3"/>
   </g>
 </svg>'''
-    return svg_content
+
+def create_diver_svg(size):
+    """Create a simple diver silhouette SVG"""
+    return _SVG_TEMPLATE.format(size=size, half=size // 2, radius=size // 2 - 2, scale=size / 100)
+
+def convert_svg(target):
+    """Rasterize the SVG for one (size, png_file) with rsvg-convert; True on success"""
+    size, png_file = target
+    try:
+        # rsvg-convert reads the SVG from stdin when no input file is given
+        subprocess.run([
+            'rsvg-convert', 
+            '-w', str(size), 
+            '-h', str(size), 
+            '-o', png_file
+        ], input=create_diver_svg(size), text=True, check=True, capture_output=True)
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return False
+    return True
+
+def _mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+def export_with_inkscape(targets):
+    """Render every (size, png_file) in one inkscape --shell session"""
+    # The PNGs are committed, so only count files inkscape actually rewrote
+    before = {png_file: _mtime(png_file) for _, png_file in targets}
+    with tempfile.TemporaryDirectory() as svg_dir:
+        # Each size gets its own SVG so the 2px circle margin stays 2px
+        script = ''
+        for size, png_file in targets:
+            svg_file = os.path.join(svg_dir, f"icon_{size}x{size}.svg")
+            with open(svg_file, 'w') as f:
+                f.write(create_diver_svg(size))
+            script += (f"file-open:{svg_file};export-filename:{png_file};"
+                       f"export-width:{size};export-height:{size};export-do;\n")
+        try:
+            subprocess.run(['inkscape', '--shell'], input=script, text=True,
+                           check=True, capture_output=True)
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            return False
+    return all(_mtime(png_file) not in (None, before[png_file]) for _, png_file in targets)
+
+# Diver silhouette from _SVG_TEMPLATE as (shape, x, y, width, height, alpha)
+# bounding boxes on the same 100-unit grid centred on the icon
+_DIVER_SHAPES = [
+    ('ellipse', -8, -33, 16, 16, 1.0),     # Head
+    ('rect', -4, -17, 8, 20, 1.0),         # Body
+    ('rect', -12, -12, 8, 3, 1.0),         # Arms
+    ('rect', 4, -12, 8, 3, 1.0),
+    ('rect', -6, 3, 3, 15, 1.0),           # Legs
+    ('rect', 3, 3, 3, 15, 1.0),
+    ('ellipse', -8.5, 20, 8, 4, 1.0),      # Flippers
+    ('ellipse', 0.5, 20, 8, 4, 1.0),
+    ('rect', -2, -15, 4, 12, 0.8),         # Tank on back
+    ('ellipse', -17, -32, 4, 4, 0.6),      # Bubbles
+    ('ellipse', -19.5, -36.5, 3, 3, 0.4),
+    ('ellipse', -13, -39, 2, 2, 0.3),
+]
+
+def render_with_quartz(targets):
+    """Draw every (size, png_file) directly with CoreGraphics (macOS only)
+
+    Returns False if pyobjc's Quartz bindings are not available.
+    """
+    try:
+        import Quartz
+    except ImportError:
+        return False
+    
+    color_space = Quartz.CGColorSpaceCreateDeviceRGB()
+    for size, png_file in targets:
+        ctx = Quartz.CGBitmapContextCreate(None, size, size, 8, 0, color_space,
+                                           Quartz.kCGImageAlphaPremultipliedLast)
+        # Flip to SVG's top-left origin so the coordinates match _SVG_TEMPLATE
+        Quartz.CGContextTranslateCTM(ctx, 0, size)
+        Quartz.CGContextScaleCTM(ctx, 1, -1)
+        
+        # Blue background circle
+        half, radius = size // 2, size // 2 - 2
+        Quartz.CGContextSetRGBFillColor(ctx, 0x1B / 255, 0x4D / 255, 0x84 / 255, 1)
+        Quartz.CGContextFillEllipseInRect(
+            ctx, Quartz.CGRectMake(half - radius, half - radius, 2 * radius, 2 * radius))
+        
+        # Diver silhouette
+        Quartz.CGContextTranslateCTM(ctx, half, half)
+        Quartz.CGContextScaleCTM(ctx, size / 100, size / 100)
+        for shape, x, y, width, height, alpha in _DIVER_SHAPES:
+            Quartz.CGContextSetRGBFillColor(ctx, 1, 1, 1, alpha)
+            rect = Quartz.CGRectMake(x, y, width, height)
+            if shape == 'ellipse':
+                Quartz.CGContextFillEllipseInRect(ctx, rect)
+            else:
+                Quartz.CGContextFillRect(ctx, rect)
+        
+        image = Quartz.CGBitmapContextCreateImage(ctx)
+        url = Quartz.CFURLCreateWithFileSystemPath(
+            None, os.path.abspath(png_file), Quartz.kCFURLPOSIXPathStyle, False)
+        dest = Quartz.CGImageDestinationCreateWithURL(url, 'public.png', 1, None)
+        Quartz.CGImageDestinationAddImage(dest, image, None)
+        if not Quartz.CGImageDestinationFinalize(dest):
+            return False
+    return True
+
+def render_from_svg(icon_dir, targets):
+    """Rasterize the per-size SVGs with inkscape, or rsvg-convert as a fallback"""
+    # Render every size in a single inkscape process if available
+    if export_with_inkscape(targets):
+        for size, png_file in targets:
+            print(f"Converted to {png_file}")
+        return
+    
+    # Fall back to one rsvg-convert per size, run concurrently; the SVG is
+    # piped in, so nothing is written unless a conversion fails
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        results = list(executor.map(convert_svg, targets))
+    for (size, png_file), converted in zip(targets, results):
+        if converted:
+            print(f"Converted to {png_file}")
+        else:
+            svg_file = f"{icon_dir}/icon_{size}x{size}.svg"
+            with open(svg_file, 'w') as f:
+                f.write(create_diver_svg(size))
+            print(f"Could not convert to PNG (rsvg-convert not available), created {svg_file}")
 
 def main():
     # Sizes needed for macOS app icons
     sizes = [16, 32, 64, 128, 256, 512, 1024]
     
     icon_dir = "Mares Puck Pro/Assets.xcassets/AppIcon.appiconset"
+    targets = [(size, f"{icon_dir}/icon_{size}x{size}.png") for size in sizes]
     
-    # Create SVG icons and convert to PNG if possible
-    for size in sizes:
-        svg_content = create_diver_svg(size)
-        svg_file = f"{icon_dir}/icon_{size}x{size}.svg"
-        
-        # Write SVG file
-        with open(svg_file, 'w') as f:
-            f.write(svg_content)
-        
-        print(f"Created {svg_file}")
-        
-        # Try to convert to PNG if rsvg-convert is available
-        png_file = f"{icon_dir}/icon_{size}x{size}.png"
-        try:
-            subprocess.run([
-                'rsvg-convert', 
-                '-w', str(size), 
-                '-h', str(size), 
-                svg_file, 
-                '-o', png_file
-            ], check=True, capture_output=True)
-            print(f"Converted to {png_file}")
-            # Remove SVG after conversion
-            os.remove(svg_file)
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            print(f"Could not convert to PNG (rsvg-convert not available), keeping SVG")
+    # On macOS draw the PNGs in-process; elsewhere go through SVG
+    if render_with_quartz(targets):
+        for size, png_file in targets:
+            print(f"Rendered {png_file}")
+    else:
+        render_from_svg(icon_dir, targets)
     
-    # Create @2x versions (just copies for simplicity)
+    # Create @2x versions (same bytes as the next size up, written from memory)
     if os.path.exists(f"{icon_dir}/icon_16x16.png"):
         for base_size in [16, 32, 128, 256, 512]:
             src_file = f"{icon_dir}/icon_{base_size * 2}x{base_size * 2}.png"
             dst_file = f"{icon_dir}/icon_{base_size}x{base_size}@2x.png"
             if os.path.exists(src_file):
-                subprocess.run(['cp', src_file, dst_file])
+                with open(src_file, 'rb') as f:
+                    data = f.read()
+                with open(dst_file, 'wb') as f:
+                    f.write(data)
                 print(f"Created @2x version: {dst_file}")
 
 if __name__ == "__main__":
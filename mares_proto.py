@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Shared serial helpers for the Mares Puck Pro test scripts
+"""
+
+import os
+import selectors
+import sys
+import time
+
+# Mares IconHD protocol constants
+ACK = 0xAA
+END = 0xEA
+XOR = 0xA5
+CMD_VERSION = 0xC2
+
+ACK_BYTE = bytes([ACK])
+END_BYTE = bytes([END])
+
+# CMD_VERSION answers ACK + 140 bytes of device info + END
+VERSION_SIZE = 140
+VERSION_REPLY_LEN = VERSION_SIZE + 2
+
+# Commands are sent as [CMD, CMD^XOR]
+_FRAME_CACHE = {}
+
+
+def frame(cmd):
+    """Return the encoded [CMD, CMD^XOR] header for cmd, built once per command"""
+    return _FRAME_CACHE.setdefault(cmd, bytes([cmd, cmd ^ XOR]))
+
+
+def wait_for_bytes(ser, sel, deadline, limit=None):
+    """Sleep in select() until the port is readable, then read what is there.
+
+    sel is a selector with ser's file descriptor already registered for
+    EVENT_READ, so callers reading many chunks set it up only once.
+    At most limit bytes are read, if given. Returns b'' if nothing arrives
+    before deadline (a time.monotonic() value).
+    """
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return b''
+        if sel.select(remaining):
+            n = ser.in_waiting or 1
+            return ser.read(n if limit is None else min(n, limit))
+
+
+def read_frame(ser, ack=ACK, end=END, deadline=None, size=None):
+    """Read until a complete ACK...END frame arrives or the deadline passes.
+
+    deadline is an absolute time.monotonic() value (defaults to 1 s from now).
+    size is the expected frame length including ACK and END. When given, the
+    read stops only once that many bytes have arrived, so an END value inside
+    the payload cannot cut the frame short; without it the first END at a
+    chunk boundary ends the frame.
+    Returns whatever bytes were received, which may be empty or unframed.
+    """
+    if deadline is None:
+        deadline = time.monotonic() + 1.0
+
+    buf = bytearray()
+    with selectors.DefaultSelector() as sel:
+        sel.register(ser.fileno(), selectors.EVENT_READ)
+        while True:
+            limit = None if size is None else size - len(buf)
+            chunk = wait_for_bytes(ser, sel, deadline, limit)
+            if not chunk:
+                break
+            buf.extend(chunk)
+            if size is not None:
+                if len(buf) >= size:
+                    break
+            elif buf[0] == ack and buf[-1] == end:
+                break
+
+    return bytes(buf)
+
+
+def set_ftdi_latency(device, ms=1):
+    """Lower the FTDI latency timer for device (default 16 ms) to ms.
+
+    The FTDI chip holds small packets for up to the latency timer before
+    sending them over USB, so every short command/response exchange pays
+    up to 16 ms extra. The Windows (Delphi) tool gets its fast replies by
+    overriding this timer. Returns True if the timer was set; otherwise
+    this is a no-op (non-FTDI adapter, missing permissions or pyobjc).
+    """
+    if sys.platform.startswith('linux'):
+        path = f"/sys/bus/usb-serial/devices/{os.path.basename(device)}/latency_timer"
+        try:
+            with open(path, 'w') as f:
+                f.write(str(ms))
+            return True
+        except OSError:
+            return False
+
+    if sys.platform == 'darwin':
+        return _set_ftdi_latency_macos(device, ms)
+
+    return False
+
+
+def _set_ftdi_latency_macos(device, ms):
+    try:
+        import objc
+        from Foundation import NSBundle
+    except ImportError:
+        return False
+
+    iokit = NSBundle.bundleWithIdentifier_('com.apple.framework.IOKit')
+    functions = {}
+    objc.loadBundleFunctions(iokit, functions, [
+        ('IOServiceMatching', b'@*'),
+        ('IOServiceGetMatchingService', b'II@'),
+        ('IORegistryEntryGetParentEntry', b'iI*o^I'),
+        ('IOObjectConformsTo', b'ZI*'),
+        ('IORegistryEntrySetCFProperty', b'iI@@'),
+        ('IOObjectRelease', b'iI'),
+    ])
+
+    # Find the serial node that owns this /dev entry
+    key = 'IODialinDevice' if os.path.basename(device).startswith('tty.') else 'IOCalloutDevice'
+    matching = functions['IOServiceMatching'](b'IOSerialBSDClient')
+    matching['IOPropertyMatch'] = {key: device}
+    entry = functions['IOServiceGetMatchingService'](0, matching)
+
+    # Walk up from it to the FTDI driver; other adapters (e.g. CP210x) never match
+    while entry:
+        if (functions['IOObjectConformsTo'](entry, b'FTDIUSBSerialDriver')
+                or functions['IOObjectConformsTo'](entry, b'AppleUSBFTDI')):
+            status = functions['IORegistryEntrySetCFProperty'](entry, 'LatencyTimer', ms)
+            functions['IOObjectRelease'](entry)
+            return status == 0
+        status, parent = functions['IORegistryEntryGetParentEntry'](entry, b'IOService', None)
+        functions['IOObjectRelease'](entry)
+        entry = parent if status == 0 else 0
+
+    return False
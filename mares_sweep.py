@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Run the Mares Puck Pro serial experiments over a single open port
+
+Each experiment is a SerialTest. Baud rate and RTS/DTR lines are changed
+between tests on the live handle instead of closing and reopening the port.
+"""
+
+import argparse
+import termios
+import time
+import traceback
+from dataclasses import dataclass
+from typing import Optional
+
+import serial
+
+from mares_proto import (ACK, ACK_BYTE, CMD_VERSION, END, END_BYTE, VERSION_REPLY_LEN,
+                         frame, read_frame, set_ftdi_latency)
+
+DEVICE = '/dev/cu.usbserial-00085C7C'
+
+VERBOSE = True  # Set to False to skip hex dumps on long sweeps
+
+@dataclass
+class SerialTest:
+    name: str
+    baud: int = 9600
+    rts: bool = False
+    dtr: bool = False
+    cmd: bytes = frame(CMD_VERSION)  # b'' just listens
+    wait_ms: int = 1000
+    reply_len: Optional[int] = None  # Known frame length; None stops at the first END
+    after_invalid: bool = False  # Only run if the previous test got an unframed reply
+
+# pyserial asserts RTS and DTR on open; tests that never touched the
+# lines use rts=True, dtr=True to keep that behaviour
+EXACT_TESTS = [
+    SerialTest("Exact Mares CMD_VERSION header", rts=True, dtr=True, wait_ms=1500,
+               reply_len=VERSION_REPLY_LEN),
+]
+
+RTS_TESTS = [
+    SerialTest("CMD_VERSION with RTS/DTR cleared", wait_ms=1500, reply_len=VERSION_REPLY_LEN),
+    SerialTest("Waiting for more data", cmd=b'', wait_ms=1500, after_invalid=True),
+]
+
+VARIATION_TESTS = [
+    SerialTest("CMD_VERSION standard", wait_ms=500, reply_len=VERSION_REPLY_LEN),
+    SerialTest("CMD_VERSION inverted", cmd=frame(CMD_VERSION)[::-1], wait_ms=500),
+    SerialTest("Just CMD_VERSION", cmd=bytes([CMD_VERSION]), wait_ms=500),
+    SerialTest("Wake up + CMD_VERSION", cmd=b'\x1B' + frame(CMD_VERSION), wait_ms=500,
+               reply_len=VERSION_REPLY_LEN),
+    SerialTest("Different Mares wake", cmd=b'\x55\xAA' + frame(CMD_VERSION), wait_ms=500,
+               reply_len=VERSION_REPLY_LEN),
+    SerialTest("IconHD specific", cmd=b'\x10\x10' + frame(CMD_VERSION), wait_ms=500,
+               reply_len=VERSION_REPLY_LEN),
+]
+
+SIMPLE_TESTS = [
+    SerialTest("Single CMD_VERSION byte", rts=True, dtr=True, cmd=bytes([CMD_VERSION])),
+]
+
+GENTLE_TESTS = [
+    SerialTest("Listen for spontaneous data", rts=True, dtr=True, cmd=b'', wait_ms=5000),
+    SerialTest("Single gentle byte", rts=True, dtr=True, cmd=bytes([CMD_VERSION]), wait_ms=3000),
+    SerialTest("Single byte at 4800 baud", baud=4800, rts=True, dtr=True, cmd=bytes([CMD_VERSION]), wait_ms=2000),
+]
+
+PROTOCOL_TESTS = [
+    SerialTest("CMD_VERSION byte with RTS cleared", dtr=True, cmd=bytes([CMD_VERSION]), wait_ms=2000),
+    SerialTest("CMD_VERSION byte with RTS and DTR cleared", cmd=bytes([CMD_VERSION]), wait_ms=2000),
+]
+
+SERIAL_TESTS = [
+    SerialTest("Gentle ESC wake-up", rts=True, dtr=True, cmd=b'\x1B', wait_ms=2000),
+    SerialTest("Listen for spontaneous data", rts=True, dtr=True, cmd=b'', wait_ms=3000),
+    SerialTest("Wait for any incoming data", rts=True, dtr=True, cmd=b'', wait_ms=2000),
+]
+
+TESTS = (EXACT_TESTS + RTS_TESTS + VARIATION_TESTS + SIMPLE_TESTS
+         + GENTLE_TESTS + PROTOCOL_TESTS + SERIAL_TESTS)
+
+def settle_lines(ser, slow=False):
+    """Give the device time to react to an RTS/DTR change
+
+    USB-serial lines settle in well under a millisecond, so drain pending
+    output and allow a short 20 ms margin. slow restores the old 0.5 s wait
+    in case a particular Puck Pro needs it.
+    """
+    if slow:
+        time.sleep(0.5)
+        return
+    termios.tcdrain(ser.fileno())
+    time.sleep(0.02)
+
+def report(test, response):
+    """Print the outcome of one test; returns True for a valid Mares frame"""
+    if not response:
+        print("No data received" if not test.cmd else "No response")
+        return False
+
+    if VERBOSE:
+        print(f"Response: {response.hex(sep=' ')} ({len(response)} bytes)")
+
+    # Check framing on a memoryview so the payload is never copied
+    mv = memoryview(response)
+    if len(mv) >= 2 and mv[0] == ACK and mv[-1] == END:
+        print("✅ Valid Mares response!")
+        if VERBOSE:
+            payload = mv[1:-1]
+            print(f"Data: {payload.hex()}")
+        return True
+
+    if response == b'\x8f\x02':
+        print("Got error response 8f02")
+    else:
+        print("Unknown response format")
+        if response[:1] == ACK_BYTE:
+            print(f"  [0]: 0x{response[0]:02x} - ACK")
+        if response[-1:] == END_BYTE:
+            print(f"  [{len(response) - 1}]: 0x{response[-1]:02x} - END")
+    return False
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--slow-settle', action='store_true',
+                        help="wait 0.5 s after every RTS/DTR change (old behaviour)")
+    return parser.parse_args()
+
+def run(tests, device=DEVICE, stop_on_valid=False, slow_settle=False):
+    """Run tests in order over one open port"""
+    try:
+        if not set_ftdi_latency(device):
+            print("Note: FTDI latency timer left unchanged (not an FTDI adapter, or not permitted)")
+
+        first = tests[0]
+        ser = serial.Serial()
+        ser.port = device
+        ser.baudrate = first.baud
+        ser.timeout = 1.5
+        ser.rtscts = False  # Disable hardware flow control
+        ser.dsrdtr = False  # Disable DTR/DSR flow control
+        # Line states set before open() are applied as the port opens
+        ser.rts = first.rts
+        ser.dtr = first.dtr
+        ser.open()
+        try:
+            print(f"Serial port opened: {ser.name}")
+            settle_lines(ser, slow_settle)
+            ser.reset_input_buffer()
+
+            last_unframed = False
+            stale = False  # Previous read timed out or was unframed; late bytes may follow
+            for test in tests:
+                if test.after_invalid and not last_unframed:
+                    continue
+
+                print(f"\n--- {test.name} ({test.baud} baud, RTS={test.rts}, DTR={test.dtr}) ---")
+
+                if ser.baudrate != test.baud:
+                    ser.baudrate = test.baud
+                    ser.reset_input_buffer()
+                    stale = False
+
+                if ser.rts != test.rts or ser.dtr != test.dtr:
+                    ser.rts = test.rts
+                    ser.dtr = test.dtr
+                    settle_lines(ser, slow_settle)
+                    ser.reset_input_buffer()
+                    stale = False
+
+                if test.cmd:
+                    if stale:
+                        # Drop a late or leftover reply so it isn't taken for this test's
+                        ser.reset_input_buffer()
+                    if VERBOSE:
+                        print(f"Sending: {test.cmd.hex()}")
+                    ser.write(test.cmd)
+                    # flush() is tcdrain: it blocks until the command has left
+                    # the UART, so the reply deadline starts from there
+                    ser.flush()
+                else:
+                    print(f"Listening for {test.wait_ms} ms...")
+
+                response = read_frame(ser, deadline=time.monotonic() + test.wait_ms / 1000,
+                                      size=test.reply_len)
+                valid = report(test, response)
+                last_unframed = bool(response) and not valid
+                stale = not valid
+                if valid and stop_on_valid:
+                    break  # Found working command
+        finally:
+            ser.close()
+            print("\nSerial port closed")
+
+    except Exception as e:
+        print(f"Error: {e}")
+        traceback.print_exc()
+
+def main():
+    run(TESTS, slow_settle=parse_args().slow_settle)
+
+if __name__ == "__main__":
+    main()
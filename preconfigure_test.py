@@ -1,56 +1,63 @@
 #!/usr/bin/env python3
-import subprocess
+import termios
 import time
 import serial
 
+from mares_proto import read_frame, set_ftdi_latency
+
 def test_preconfigured_port():
     device = '/dev/cu.usbserial-00085C7C'
     
     print("=== Pre-configured Port Test ===")
     
     try:
-        # Configure port with stty before Python opens it
-        print("Pre-configuring serial port with stty...")
-        
-        stty_commands = [
-            ['stty', '-f', device, '9600'],           # Set baud rate
-            ['stty', '-f', device, 'cs8'],            # 8 data bits
-            ['stty', '-f', device, '-parenb'],        # No parity
-            ['stty', '-f', device, '-cstopb'],        # 1 stop bit
-            ['stty', '-f', device, '-crtscts'],       # No hardware flow control
-            ['stty', '-f', device, '-cdtr_iflow'],    # No DTR input flow control
-            ['stty', '-f', device, '-ccts_oflow'],    # No CTS output flow control
-        ]
-        
-        for cmd in stty_commands:
-            try:
-                result = subprocess.run(cmd, capture_output=True, text=True)
-                if result.returncode == 0:
-                    print(f"✓ {' '.join(cmd[2:])}")
-                else:
-                    print(f"✗ {' '.join(cmd[2:])}: {result.stderr.strip()}")
-            except Exception as e:
-                print(f"✗ {' '.join(cmd[2:])}: {e}")
-        
-        print("\nWaiting 2 seconds after configuration...")
-        time.sleep(2)
+        if not set_ftdi_latency(device):
+            print("Note: FTDI latency timer left unchanged (not an FTDI adapter, or not permitted)")
         
-        # Now try to open with Python - but don't change any settings
+        # Open with minimal Python settings, then configure the line directly
         print("Opening port with minimal Python settings...")
         ser = serial.Serial()
         ser.port = device
         ser.timeout = 2
-        # Don't set any other parameters - use what stty configured
         
         ser.open()
         print("Port opened successfully")
         
+        # Same settings the stty pre-configuration applied, via termios on the open fd
+        print("Configuring serial port with termios...")
+        iflag, oflag, cflag, lflag, ispeed, ospeed, cc = termios.tcgetattr(ser.fileno())
+        
+        # Flow-control flags by stty name; not every platform's termios has them all
+        flow_settings = [
+            ('-crtscts', 'CRTSCTS'),        # No hardware flow control
+            ('-cdtr_iflow', 'CDTR_IFLOW'),  # No DTR input flow control (macOS only)
+            ('-ccts_oflow', 'CCTS_OFLOW'),  # No CTS output flow control (macOS only)
+        ]
+        applied = ['9600', 'cs8', '-parenb', '-cstopb']
+        missing = []
+        flow_flags = 0
+        for setting, name in flow_settings:
+            flag = getattr(termios, name, None)
+            if flag is None:
+                missing.append(setting)
+            else:
+                flow_flags |= flag
+                applied.append(setting)
+        
+        cflag &= ~(termios.CSIZE | termios.PARENB | termios.CSTOPB | flow_flags)
+        cflag |= termios.CS8
+        ispeed = ospeed = termios.B9600
+        termios.tcsetattr(ser.fileno(), termios.TCSANOW,
+                          [iflag, oflag, cflag, lflag, ispeed, ospeed, cc])
+        print(f"✓ {' '.join(applied)}")
+        for setting in missing:
+            print(f"✗ {setting}: not supported by this platform's termios")
+        
         # Wait and listen
         print("Listening for 3 seconds without sending anything...")
-        time.sleep(3)
+        data = read_frame(ser, deadline=time.monotonic() + 3)
         
-        if ser.in_waiting > 0:
-            data = ser.read(ser.in_waiting)
+        if data:
             print(f"Received data: {data.hex()}")
         else:
             print("No data received")
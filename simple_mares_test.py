@@ -1,26 +1,5 @@
 #!/usr/bin/env python3
-import serial
-import time
+from mares_sweep import SIMPLE_TESTS, parse_args, run
 
-try:
-    # Very basic serial connection
-    ser = serial.Serial('/dev/cu.usbserial-00085C7C', 9600, timeout=2)
-    print(f"Connected to {ser.name}")
-    
-    # Send Mares VERSION command instead of random data
-    print("Sending Mares CMD_VERSION (0xC2)...")
-    ser.write(b'\xC2')
-    time.sleep(1)
-    
-    if ser.in_waiting > 0:
-        response = ser.read(ser.in_waiting)
-        print(f"Got response: {response.hex()} ('{response}')")
-    else:
-        print("No response")
-    
-    ser.close()
-    
-except Exception as e:
-    print(f"Error: {e}")
-    import traceback
-    traceback.print_exc()
\ No newline at end of file
+# Very basic serial connection: send Mares VERSION command instead of random data
+run(SIMPLE_TESTS, slow_settle=parse_args().slow_settle)